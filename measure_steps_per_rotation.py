@@ -20,48 +20,108 @@ import time
 import serial
 
 
-def send_command(port, command, has_response=False, ignore_error=False):
+def read_reply(port, buffer, lines):
     """
-    Sends a motor control command and validates that it was processed correctly.
-    Optionally returns the motor response if has_response is True.
+    Reads from port into buffer until it contains the given number of lines followed by a prompt character.
+    Data is read in as large chunks as are available instead of a line or byte at a time.
+    Returns a list of the decoded lines and the prompt, removing them from buffer.
+    Throws exceptions if the full reply hasn't arrived within the port timeout.
+    """
+    timeout = serial.Timeout(port.timeout)
+    while True:
+        parts = buffer.split(b'\n', lines)
+        if len(parts) > lines and parts[lines]:
+            break
+
+        data = b'' if timeout.expired() else port.read(port.in_waiting or 1)
+        if not data:
+            raise serial.SerialException(f'timed out waiting for prompt; received `{bytes(buffer)}`')
+        buffer += data
+
+    del buffer[:len(buffer) - len(parts[lines]) + 1]
+    return [line.decode('ascii').strip() for line in parts[:lines]], parts[lines][:1].decode('ascii')
+
+
+def send_commands(port, commands, has_response=False, ignore_error=False):
+    """
+    Sends a sequence of motor control commands as a single write, drains all of their replies,
+    and then validates that each command was processed correctly.
+    Optionally returns a list of the motor responses if has_response is True.
     Throws exceptions on error.
     """
-    if port.write(('\n' + command + '\n').encode('ascii')) != len(command) + 2:
+    encoded = [command.encode('ascii') for command in commands]
+    payload = b'\n' + b'\n'.join(encoded) + b'\n'
+    if port.write(payload) != len(payload):
         raise serial.SerialException('Failed to send command')
 
-    echo = port.readline().decode('ascii').strip()
-    if echo != command:
-        cb = command.encode('ascii').hex()
-        eb = echo.encode('ascii').hex()
-        raise serial.SerialException(f'echo mismatch `{command}` != `{echo}`; {cb} != {eb}')
+    buffer = bytearray()
+    replies = [read_reply(port, buffer, 2 if has_response else 1) for _ in commands]
+
+    responses = []
+    for command, command_bytes, (lines, prompt) in zip(commands, encoded, replies):
+        echo = lines[0]
+        if echo != command:
+            # Report the bytes around the first difference rather than the whole of both strings
+            echo_bytes = echo.encode('ascii')
+            i = next((k for k, (c, e) in enumerate(zip(command_bytes, echo_bytes)) if c != e),
+                     min(len(command_bytes), len(echo_bytes)))
+            cb = command_bytes[max(0, i - 4):i + 4].hex()
+            eb = echo_bytes[max(0, i - 4):i + 4].hex()
+            raise serial.SerialException(f'echo mismatch `{command}` != `{echo}` at byte {i}; {cb} != {eb}')
 
-    if has_response:
-        response = port.readline().decode('ascii').strip()
-        # print(f'{command}: {response}')
-    else:
-        # print(f'{command}')
-        response = None
+        if ignore_error and prompt == '?':
+            send_command(port, f'{command[0]}ER 0')
+        elif prompt != '>':
+            raise serial.SerialException(f'prompt `{prompt}` is not `>` after `{command}`')
 
-    prompt = port.read(1).decode('ascii')
-    if ignore_error and prompt == '?':
-        send_command(port, f'{command[0]}ER 0')
-    elif prompt != '>':
-        raise serial.SerialException(f'prompt `{prompt}` is not `>`')
+        responses.append(lines[1] if has_response else None)
+        # print(f'{command}: {responses[-1]}')
 
-    return response
+    return responses
 
 
-def wait_until_stationary(port):
+def send_command(port, command, has_response=False, ignore_error=False):
+    """
+    Sends a motor control command and validates that it was processed correctly.
+    Optionally returns the motor response if has_response is True.
+    Throws exceptions on error.
+    """
+    return send_commands(port, [command], has_response, ignore_error)[0]
+
+
+def wait_until_stationary(port, timeout_seconds):
+    """
+    Polls the azimuth motor until it reports that it has stopped moving.
+    Throws exceptions if the motor is still moving after timeout_seconds.
+    Polling starts every 0.1 seconds and backs off to every 5 seconds while the motor is moving.
+    A stationary report is confirmed by a second poll after a short fixed delay so that a move
+    which has not started yet is not mistaken for one that has finished.
+    """
+    confirm_delay = 0.1
+    delay = confirm_delay
+    stationary_count = 0
+    timeout_end = time.monotonic() + timeout_seconds
     while True:
-        response = send_command(port, 'APR MV', has_response=True)
-        if response == '0':
-            return
-        time.sleep(5)
+        if send_command(port, 'APR MV', has_response=True) == '0':
+            stationary_count += 1
+            if stationary_count == 2:
+                return
+            sleep_seconds = confirm_delay
+        else:
+            remaining = timeout_end - time.monotonic()
+            if remaining <= 0:
+                raise serial.SerialException(f'motor did not stop moving within {timeout_seconds} seconds')
+
+            stationary_count = 0
+            sleep_seconds = min(delay, remaining)
+            delay = min(delay * 1.5, 5.0)
+
+        time.sleep(sleep_seconds)
 
 
-def run(path, baud, timeout):
+def run(path, baud, timeout, move_timeout):
     # Connect and reboot
-    port = serial.Serial(path, baud, timeout=timeout)
+    port = serial.Serial(path, baud, timeout=timeout, write_timeout=timeout)
     port.flushInput()
     port.flushOutput()
     if port.write(b'\x03') != 1:
@@ -70,24 +130,23 @@ def run(path, baud, timeout):
 
     # Nudge away from the limit
     send_command(port, 'AMR 500000')
-    wait_until_stationary(port)
+    wait_until_stationary(port, move_timeout)
 
     # Find home
     send_command(port, 'AHM 1')
-    wait_until_stationary(port)
-    send_command(port, 'AP=0')
+    wait_until_stationary(port, move_timeout)
 
-    # Force a full rotation
-    send_command(port, 'AHM 3')
-    wait_until_stationary(port)
+    # Zero the position and force a full rotation
+    send_commands(port, ['AP=0', 'AHM 3'])
+    wait_until_stationary(port, move_timeout)
 
     # Run past the home switch
     send_command(port, 'AMR 500000')
-    wait_until_stationary(port)
+    wait_until_stationary(port, move_timeout)
 
     # Return to home from the same direction we started
     send_command(port, 'AHM 1')
-    wait_until_stationary(port)
+    wait_until_stationary(port, move_timeout)
 
     response = send_command(port, 'APR P', has_response=True)
     print(f'Steps per full rotation: {response}')
@@ -100,5 +159,6 @@ if __name__ == '__main__':
     parser.add_argument('port')
     parser.add_argument('--baud', type=int, default=9600)
     parser.add_argument('--timeout', type=int, default=3)
+    parser.add_argument('--move-timeout', type=int, default=180)
     args = parser.parse_args()
-    run(args.port, args.baud, args.timeout)
+    run(args.port, args.baud, args.timeout, args.move_timeout)
@@ -18,8 +18,19 @@
 
 # pylint: disable=too-many-instance-attributes
 
-import json
-from rockit.common import daemons, IP, validation
+from dataclasses import dataclass
+import fastjsonschema
+from rockit.common import daemons, IP
+
+# Prefer the faster orjson parser if it is installed
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+# Snapshot the registered daemons and machines so lookups are plain dict accesses
+_DAEMONS = {k: getattr(daemons, k) for k in dir(daemons) if not k.startswith('_')}
+_IP = {k: getattr(IP, k) for k in dir(IP) if not k.startswith('_')}
 
 CONFIG_SCHEMA = {
     'type': 'object',
@@ -33,7 +44,7 @@ CONFIG_SCHEMA = {
     'properties': {
         'daemon': {
             'type': 'string',
-            'daemon_name': True
+            'format': 'daemon_name'
         },
         'log_name': {
             'type': 'string'
@@ -42,7 +53,7 @@ CONFIG_SCHEMA = {
             'type': 'array',
             'items': {
                 'type': 'string',
-                'machine_name': True
+                'format': 'machine_name'
             }
         },
         'serial_port': {
@@ -101,62 +112,127 @@ CONFIG_SCHEMA = {
         },
         'idle_loop_delay': {
             'type': 'number',
-            'min': 0
+            'minimum': 0
         },
         'moving_loop_delay': {
             'type': 'number',
-            'min': 0
+            'minimum': 0
         },
         'azimuth_move_timeout': {
             'type': 'number',
-            'min': 0
+            'minimum': 0
         },
         'shutter_move_timeout': {
             'type': 'number',
-            'min': 0
+            'minimum': 0
         },
         'telescope_machines': {
             'type': 'array',
             'items': {
                 'type': 'string',
-                'machine_name': True
+                'format': 'machine_name'
             }
         }
     }
 }
 
+# Generate the schema validator once at import rather than every time a config is loaded
+_schema_validator = fastjsonschema.compile(CONFIG_SCHEMA, formats={
+    'daemon_name': lambda name: name in _DAEMONS,
+    'machine_name': lambda name: name in _IP,
+})
+
+_FORMAT_DESCRIPTIONS = {
+    'daemon_name': 'a daemon registered in rockit.common.daemons',
+    'machine_name': 'a machine registered in rockit.common.IP',
+}
+
+
+def _validate_config(config_json):
+    """
+    Validates config_json against CONFIG_SCHEMA.
+    Throws JsonSchemaValueException describing the first violation.
+    """
+    try:
+        _schema_validator(config_json)
+    except fastjsonschema.JsonSchemaValueException as e:
+        # The generated messages for custom formats only name the format, so name the invalid value instead
+        if e.rule == 'format' and e.definition.get('format') in _FORMAT_DESCRIPTIONS:
+            message = f'{e.name} `{e.value}` is not {_FORMAT_DESCRIPTIONS[e.definition["format"]]}'
+            raise fastjsonschema.JsonSchemaValueException(message, e.value, e.name, e.definition, e.rule) from None
+        raise
 
+
+@dataclass(frozen=True)
 class Config:
     """Daemon configuration parsed from a json file"""
-    def __init__(self, config_filename):
+    __slots__ = (
+        'daemon', 'log_name', 'control_ips', 'telescope_ips', 'serial_port', 'serial_baud', 'serial_timeout',
+        'serial_retries', 'steps_per_rotation', 'dome_radius_cm', 'telescope_offset_x_cm', 'home_azimuth',
+        'park_azimuth', 'tracking_max_separation', 'idle_loop_delay', 'moving_loop_delay', 'azimuth_move_timeout',
+        'shutter_move_timeout', 'latitude', 'longitude', 'altitude'
+    )
+
+    daemon: object
+    log_name: str
+    control_ips: tuple
+    telescope_ips: tuple
+    serial_port: str
+    serial_baud: int
+    serial_timeout: float
+    serial_retries: int
+    steps_per_rotation: float
+    dome_radius_cm: int
+    telescope_offset_x_cm: int
+    home_azimuth: float
+    park_azimuth: float
+    tracking_max_separation: float
+    idle_loop_delay: int
+    moving_loop_delay: int
+    azimuth_move_timeout: int
+    shutter_move_timeout: int
+    latitude: float
+    longitude: float
+    altitude: float
+
+    # dataclass(slots=True) requires python 3.10, so provide the state methods it would
+    # generate to allow copy and pickle to restore the frozen fields
+    def __getstate__(self):
+        return [getattr(self, field) for field in self.__slots__]
+
+    def __setstate__(self, state):
+        for field, value in zip(self.__slots__, state):
+            object.__setattr__(self, field, value)
+
+    @classmethod
+    def from_file(cls, config_filename):
+        """Parses and validates a json config file"""
         # Will throw on file not found or invalid json
-        with open(config_filename, 'r', encoding='utf-8') as config_file:
-            config_json = json.load(config_file)
+        with open(config_filename, 'rb') as config_file:
+            config_json = json.loads(config_file.read())
 
         # Will throw on schema violations
-        validation.validate_config(config_json, CONFIG_SCHEMA, {
-            'daemon_name': validation.daemon_name_validator,
-            'directory_path': validation.directory_path_validator,
-        })
-
-        self.daemon = getattr(daemons, config_json['daemon'])
-        self.log_name = config_json['log_name']
-        self.control_ips = [getattr(IP, machine) for machine in config_json['control_machines']]
-        self.telescope_ips = [getattr(IP, machine) for machine in config_json['telescope_machines']]
-        self.serial_port = config_json['serial_port']
-        self.serial_baud = config_json['serial_baud']
-        self.serial_timeout = config_json['serial_timeout']
-        self.serial_retries = config_json['serial_retries']
-        self.steps_per_rotation = config_json['steps_per_rotation']
-        self.dome_radius_cm = config_json['dome_radius_cm']
-        self.telescope_offset_x_cm = config_json['telescope_offset_x_cm']
-        self.home_azimuth = config_json['home_azimuth']
-        self.park_azimuth = config_json['park_azimuth']
-        self.tracking_max_separation = config_json['tracking_max_separation']
-        self.idle_loop_delay = int(config_json['idle_loop_delay'])
-        self.moving_loop_delay = int(config_json['moving_loop_delay'])
-        self.azimuth_move_timeout = int(config_json['azimuth_move_timeout'])
-        self.shutter_move_timeout = int(config_json['shutter_move_timeout'])
-        self.latitude = float(config_json['latitude'])
-        self.longitude = float(config_json['longitude'])
-        self.altitude = float(config_json['altitude'])
+        _validate_config(config_json)
+
+        return cls(
+            daemon=_DAEMONS[config_json['daemon']],
+            log_name=config_json['log_name'],
+            control_ips=tuple(_IP[machine] for machine in config_json['control_machines']),
+            telescope_ips=tuple(_IP[machine] for machine in config_json['telescope_machines']),
+            serial_port=config_json['serial_port'],
+            serial_baud=config_json['serial_baud'],
+            serial_timeout=config_json['serial_timeout'],
+            serial_retries=config_json['serial_retries'],
+            steps_per_rotation=config_json['steps_per_rotation'],
+            dome_radius_cm=config_json['dome_radius_cm'],
+            telescope_offset_x_cm=config_json['telescope_offset_x_cm'],
+            home_azimuth=config_json['home_azimuth'],
+            park_azimuth=config_json['park_azimuth'],
+            tracking_max_separation=config_json['tracking_max_separation'],
+            idle_loop_delay=int(config_json['idle_loop_delay']),
+            moving_loop_delay=int(config_json['moving_loop_delay']),
+            azimuth_move_timeout=int(config_json['azimuth_move_timeout']),
+            shutter_move_timeout=int(config_json['shutter_move_timeout']),
+            latitude=float(config_json['latitude']),
+            longitude=float(config_json['longitude']),
+            altitude=float(config_json['altitude']))
@@ -16,6 +16,14 @@
 
 """Constants and status codes used by ashdomed"""
 
+_UNKNOWN_PLAIN = 'UNKNOWN'
+_UNKNOWN_FORMATTED = '[b][red]UNKNOWN[/red][/b]'
+
+
+def _format_labels(labels, colors):
+    """Builds the terminal formatted version of each status label"""
+    return tuple(f'[b][{c}]{label}[/{c}][/b]' for label, c in zip(labels, colors))
+
 
 class CommandStatus:
     """Numeric return codes"""
@@ -69,21 +77,23 @@ class AzimuthStatus:
     """Status of the dome rotation"""
     Disconnected, NotHomed, Idle, Moving, Homing = range(5)
 
-    _labels = {
-        0: 'DISCONNECTED',
-        1: 'NOT HOMED',
-        2: 'IDLE',
-        3: 'MOVING',
-        4: 'HOMING'
-    }
+    _labels = (
+        'DISCONNECTED',
+        'NOT HOMED',
+        'IDLE',
+        'MOVING',
+        'HOMING'
+    )
 
-    _colors = {
-        0: 'red',
-        1: 'red',
-        2: 'default',
-        3: 'yellow',
-        4: 'yellow'
-    }
+    _colors = (
+        'red',
+        'red',
+        'default',
+        'yellow',
+        'yellow'
+    )
+
+    _formatted = _format_labels(_labels, _colors)
 
     @classmethod
     def label(cls, status, formatting=False):
@@ -91,39 +101,36 @@ class AzimuthStatus:
         Returns a human readable string describing a status
         Set formatting=true to enable terminal formatting characters
         """
-        if formatting:
-            if status in cls._labels and status in cls._colors:
-                return f'[b][{cls._colors[status]}]{cls._labels[status]}[/{cls._colors[status]}][/b]'
-            return '[b][red]UNKNOWN[/red][/b]'
-
-        if status in cls._labels:
-            return cls._labels[status]
-        return 'UNKNOWN'
+        if 0 <= status < len(cls._labels):
+            return cls._formatted[status] if formatting else cls._labels[status]
+        return _UNKNOWN_FORMATTED if formatting else _UNKNOWN_PLAIN
 
 
 class ShutterStatus:
     """Status of the dome shutter"""
     Disconnected, Closed, Open, PartiallyOpen, Opening, Closing, HeartbeatMonitorForceClosing = range(7)
 
-    _labels = {
-        0: 'DISCONNECTED',
-        1: 'CLOSED',
-        2: 'OPEN',
-        3: 'PARTIALLY OPEN',
-        4: 'OPENING',
-        5: 'CLOSING',
-        6: 'FORCE CLOSING',
-    }
-
-    _colors = {
-        0: 'red',
-        1: 'red',
-        2: 'green',
-        3: 'cyan',
-        4: 'yellow',
-        5: 'yellow',
-        6: 'red',
-    }
+    _labels = (
+        'DISCONNECTED',
+        'CLOSED',
+        'OPEN',
+        'PARTIALLY OPEN',
+        'OPENING',
+        'CLOSING',
+        'FORCE CLOSING',
+    )
+
+    _colors = (
+        'red',
+        'red',
+        'green',
+        'cyan',
+        'yellow',
+        'yellow',
+        'red',
+    )
+
+    _formatted = _format_labels(_labels, _colors)
 
     @classmethod
     def label(cls, status, formatting=False):
@@ -131,33 +138,30 @@ class ShutterStatus:
         Returns a human readable string describing a status
         Set formatting=true to enable terminal formatting characters
         """
-        if formatting:
-            if status in cls._labels and status in cls._colors:
-                return f'[b][{cls._colors[status]}]{cls._labels[status]}[/{cls._colors[status]}][/b]'
-            return '[b][red]UNKNOWN[/red][/b]'
-
-        if status in cls._labels:
-            return cls._labels[status]
-        return 'UNKNOWN'
+        if 0 <= status < len(cls._labels):
+            return cls._formatted[status] if formatting else cls._labels[status]
+        return _UNKNOWN_FORMATTED if formatting else _UNKNOWN_PLAIN
 
 
 class HeartbeatStatus:
     """Status of the dome heartbeat monitoring"""
     Disabled, Active, TrippedClosing, TrippedIdle = range(4)
 
-    _labels = {
-        0: 'DISABLED',
-        1: 'ACTIVE',
-        2: 'CLOSING DOME',
-        3: 'TRIPPED'
-    }
+    _labels = (
+        'DISABLED',
+        'ACTIVE',
+        'CLOSING DOME',
+        'TRIPPED'
+    )
 
-    _colors = {
-        0: 'default',
-        1: 'green',
-        2: 'red',
-        3: 'red'
-    }
+    _colors = (
+        'default',
+        'green',
+        'red',
+        'red'
+    )
+
+    _formatted = _format_labels(_labels, _colors)
 
     @classmethod
     def label(cls, status, formatting=False):
@@ -165,11 +169,6 @@ class HeartbeatStatus:
         Returns a human readable string describing a status
         Set formatting=true to enable terminal formatting characters
         """
-        if formatting:
-            if status in cls._labels and status in cls._colors:
-                return f'[b][{cls._colors[status]}]{cls._labels[status]}[/{cls._colors[status]}][/b]'
-            return '[b][red]UNKNOWN[/red][/b]'
-
-        if status in cls._labels:
-            return cls._labels[status]
-        return 'UNKNOWN'
+        if 0 <= status < len(cls._labels):
+            return cls._formatted[status] if formatting else cls._labels[status]
+        return _UNKNOWN_FORMATTED if formatting else _UNKNOWN_PLAIN